@@ -7,16 +7,54 @@ Date: October 2025
 
 # Requires: pip install google-genai
 
+import gc
+import io
 import os
+import re
 import json
+import time
+import atexit
+import asyncio
+import threading
+import hashlib
+import functools
+import importlib.util
+from collections import OrderedDict
 from datetime import datetime
+from itertools import groupby
 # Use Google Gemini (Google GenAI SDK)
 try:
     from google import genai
+    from google.genai import errors
     from google.genai import types
+    import httpx
 except Exception:
     raise ImportError("Missing google-genai SDK. Install with: pip install google-genai")
 
+# Optional: LLMLingua prompt compression (pip install llmlingua)
+try:
+    from llmlingua import PromptCompressor
+except ImportError:
+    PromptCompressor = None
+
+# Optional: faster JSON serialization for history (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: streaming parser for large legacy history files (pip install ijson)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: persistent on-disk response cache (pip install diskcache)
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 import sys
 
 # ============================================================================
@@ -39,8 +77,87 @@ class Config:
     # Temperature (0-1, lower = more focused, higher = more creative)
     TEMPERATURE = 0.7
     
-    # Chat history file location
-    HISTORY_FILE = "chat_history.json"
+    # Concurrency settings for batch workloads (see AIChatbot.send_many)
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Number of questions sent together per answer_faq_batch round
+    BATCH_SIZE = 20
+    
+    # Gemini Batch API polling interval (seconds) for summarize_bulk
+    BATCH_POLL_INTERVAL = 30
+    
+    # Give up waiting for a batch job after this long (seconds); matches the
+    # Batch API's 24h completion window
+    BATCH_TIMEOUT = 86400
+    
+    # Connection pool for the persistent async HTTP client (HTTP/2 is used
+    # when the h2 package is installed: pip install "httpx[http2]")
+    MAX_CONNECTIONS = 64
+    MAX_KEEPALIVE_CONNECTIONS = 32
+    
+    # Retry attempts for rate-limited (429) or server-side (5xx) failures
+    MAX_ATTEMPTS = 5
+    
+    # Rate limits of your Gemini API tier (requests / tokens per minute)
+    MAX_REQUESTS_PER_MINUTE = 60
+    MAX_TOKENS_PER_MINUTE = 250000
+    
+    # Cheap rule-based cleanup (whitespace, repeated lines, JSON) of summarize inputs
+    ENABLE_RULE_COMPRESSION = True
+    
+    # Input context of MODEL (tokens); gemini-2.5-flash accepts ~1M tokens
+    MAX_INPUT_TOKENS = 1048576
+    
+    # Largest text (characters) sent in one request: ~4 characters per token,
+    # keeping 10% headroom for the prompt template and tokenizer variance
+    MAX_INPUT_CHARS = MAX_INPUT_TOKENS * 4 * 9 // 10
+    
+    # Texts longer than MAX_INPUT_CHARS are summarized map-reduce style:
+    # overlapping chunks are summarized concurrently, then merged. Each chunk
+    # uses at most a tenth of the per-minute token budget (~25K tokens), so
+    # several chunks can be in flight without tripping the rate limit.
+    CHUNK_SIZE = min(MAX_INPUT_CHARS, MAX_TOKENS_PER_MINUTE * 4 // 10)
+    CHUNK_OVERLAP = 2000
+    
+    # LLMLingua prompt compression for summarize inputs (requires llmlingua)
+    ENABLE_COMPRESSION = False
+    
+    # Fraction of tokens to keep (0.33 = roughly 3x shorter prompt)
+    COMPRESSION_RATE = 0.33
+    
+    # LLMLingua-2 compressor model and per-chunk size (characters) for long inputs
+    COMPRESSION_MODEL = "microsoft/llmlingua-2-xlm-roberta-large-meetingbank"
+    COMPRESSION_CHUNK_SIZE = 4000
+    
+    # Device the compressor model runs on ("cpu", "cuda", "mps", ...)
+    COMPRESSION_DEVICE = "cpu"
+    
+    # Cache identical requests so repeated questions skip the API call
+    # (persisted to PROMPT_CACHE_DIR when diskcache is installed, otherwise
+    # kept in memory as an LRU of PROMPT_CACHE_SIZE entries)
+    ENABLE_PROMPT_CACHE = True
+    PROMPT_CACHE_DIR = ".prompt_cache"
+    PROMPT_CACHE_TTL = 86400  # seconds
+    PROMPT_CACHE_SIZE = 1024
+    
+    # Chat history file location (JSON Lines: one entry appended per turn)
+    HISTORY_FILE = "chat_history.jsonl"
+    
+    # Buffer size (bytes) for history file reads/writes
+    IO_BUFFER_SIZE = 65536
+    
+    # Entries processed between gc.collect() calls when streaming history
+    HISTORY_GC_INTERVAL = 100
+    
+    # Pre-JSONL history file, converted on startup by migrate_history()
+    LEGACY_HISTORY_FILE = "chat_history.json"
+    
+    # Register system prompts as Gemini cached content (explicit context
+    # caching). Gemini only caches prompts above a minimum size (~1K tokens),
+    # so this is off by default; short prompts still benefit from implicit
+    # caching because they are sent as a stable system instruction.
+    ENABLE_CONTEXT_CACHE = False
+    CONTEXT_CACHE_TTL = 3600  # seconds
     
     # System prompts for different modes
     FAQ_SYSTEM_PROMPT = """You are a helpful FAQ assistant. Answer questions 
@@ -48,6 +165,303 @@ class Config:
     
     SUMMARIZE_SYSTEM_PROMPT = """You are a text summarization expert. Provide 
     clear, concise summaries that capture the main points of the given text."""
+    
+    REDUCE_SYSTEM_PROMPT = """You are a text summarization expert. You will be 
+    given partial summaries of consecutive sections of one long document. Merge 
+    them into a single clear, concise summary without repeating points."""
+
+
+# ============================================================================
+# TEXT PREPROCESSING
+# ============================================================================
+
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+# Only runs after other text: leading indentation (code, YAML) is kept
+_SPACE_RUN_RE = re.compile(r'(?<=\S)[ \t]{2,}')
+
+
+def rule_compress(text):
+    """
+    Shrink pasted text without a model by removing structural noise
+    
+    Minifies JSON documents; otherwise strips trailing whitespace,
+    collapses runs of spaces/tabs inside lines (indentation is preserved),
+    folds consecutive identical lines into "<line> (xN)" and squeezes 3+
+    newlines down to a single blank line.
+    
+    Args:
+        text (str): The text to compress
+        
+    Returns:
+        str: The compressed text
+    """
+    stripped = text.strip()
+    if stripped[:1] in ('{', '['):
+        try:
+            return json.dumps(json.loads(stripped), separators=(',', ':'), ensure_ascii=False)
+        except ValueError:
+            pass
+    
+    lines = []
+    # Normalize spacing first so lines differing only in inner spacing fold
+    normalized = (_SPACE_RUN_RE.sub(' ', line.rstrip()) for line in text.strip('\n').split('\n'))
+    for line, group in groupby(normalized):
+        count = sum(1 for _ in group)
+        if count > 1 and line:
+            line = f"{line} (x{count})"
+        elif count > 1:
+            # Keep repeated blank lines for the blank-line pass below
+            line = '\n' * (count - 1)
+        lines.append(line)
+    
+    return _BLANK_LINES_RE.sub('\n\n', '\n'.join(lines))
+
+
+def chunk_text(text, size, overlap):
+    """
+    Split text into overlapping character chunks
+    
+    Args:
+        text (str): The text to split
+        size (int): Maximum chunk length in characters
+        overlap (int): Characters shared between consecutive chunks
+        
+    Returns:
+        list: The chunks, in order
+    """
+    step = max(size - overlap, 1)
+    return [text[start:start + size] for start in range(0, max(len(text) - overlap, 1), step)]
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class RateLimiter:
+    """
+    Dual token bucket for requests-per-minute and tokens-per-minute limits
+    
+    Both buckets refill continuously, so bursts are allowed up to the
+    per-minute budget and sustained throughput settles at the limits.
+    """
+    
+    def __init__(self, max_requests_per_minute, max_tokens_per_minute):
+        """
+        Initialize both buckets at full capacity
+        
+        Args:
+            max_requests_per_minute (int): Request budget per minute
+            max_tokens_per_minute (int): Token budget per minute
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_request_capacity = max_requests_per_minute
+        self.available_token_capacity = max_tokens_per_minute
+        self.last_update = time.monotonic()
+    
+    def _replenish(self):
+        """Refill both buckets for the time elapsed since the last update"""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        
+        self.available_request_capacity = min(
+            self.max_requests_per_minute,
+            self.available_request_capacity + elapsed * self.max_requests_per_minute / 60
+        )
+        self.available_token_capacity = min(
+            self.max_tokens_per_minute,
+            self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60
+        )
+    
+    async def acquire(self, estimated_tokens=0):
+        """
+        Wait until both buckets can cover one request, then consume from them
+        
+        Args:
+            estimated_tokens (int): Tokens the upcoming request is expected to use
+            
+        Raises:
+            ValueError: If the request needs more tokens than a full minute's
+                budget, since the API would reject it however long we waited
+        """
+        if estimated_tokens > self.max_tokens_per_minute:
+            raise ValueError(
+                f"Request needs ~{estimated_tokens} tokens, more than the "
+                f"{self.max_tokens_per_minute} tokens-per-minute limit"
+            )
+        
+        while True:
+            self._replenish()
+            
+            if (self.available_request_capacity >= 1
+                    and self.available_token_capacity >= estimated_tokens):
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= estimated_tokens
+                return
+            
+            # Sleep until the emptier bucket has refilled enough
+            wait = max(
+                (1 - self.available_request_capacity) * 60 / self.max_requests_per_minute,
+                (estimated_tokens - self.available_token_capacity) * 60 / self.max_tokens_per_minute
+            )
+            await asyncio.sleep(wait)
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class LRUCache:
+    """
+    In-memory response cache used when diskcache is not installed
+    
+    Holds at most `maxsize` entries, evicting the least recently used one,
+    and supports the same get()/set(expire=...) calls as diskcache.Cache.
+    """
+    
+    def __init__(self, maxsize):
+        """
+        Initialize an empty cache
+        
+        Args:
+            maxsize (int): Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+    
+    def get(self, key, default=None):
+        """Return the unexpired value for a key, or `default`"""
+        item = self._entries.get(key)
+        if item is None:
+            return default
+        
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key, value, expire=None):
+        """
+        Store a value, evicting the least recently used entry when full
+        
+        Args:
+            key (str): The cache key
+            value: The value to store
+            expire (float): Seconds until the entry expires (None = never)
+        """
+        expires_at = time.monotonic() + expire if expire is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def prompt_cache_key(model, temperature, max_tokens, system_prompt, user_message):
+    """
+    Build the response cache key for a request
+    
+    Generation settings are part of the key, so changing them never serves
+    answers produced under the old settings.
+    
+    Args:
+        model (str): The model name
+        temperature (float): The sampling temperature
+        max_tokens (int): The response token limit
+        system_prompt (str): The system prompt (or None)
+        user_message (str): The user's input message
+        
+    Returns:
+        str: A 32-character hex digest identifying the request
+    """
+    raw = f"{model}|{temperature}|{max_tokens}|{system_prompt or ''}|{user_message}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# ============================================================================
+# HISTORY SERIALIZATION
+# ============================================================================
+
+def dump_history_line(entry):
+    """
+    Serialize a history entry to one UTF-8 encoded JSON line
+    
+    Args:
+        entry (dict): The conversation entry
+        
+    Returns:
+        bytes: The JSON line, including the trailing newline
+    """
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def load_history_json(data):
+    """
+    Parse a JSON document (one history line or a legacy history array)
+    
+    Args:
+        data (bytes): UTF-8 encoded JSON
+        
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def truncate(text, limit=200):
+    """
+    Shorten text for the history file, marking cut text with "..."
+    
+    Short text (the common case) is returned as-is without copying.
+    
+    Args:
+        text (str): The text to shorten
+        limit (int): Maximum number of characters kept
+        
+    Returns:
+        str: The original text, or its first `limit` characters plus "..."
+    """
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
+
+
+@functools.lru_cache(maxsize=1024)
+def format_timestamp(ts):
+    """
+    Format an epoch timestamp (whole seconds) for display
+    
+    Args:
+        ts (int): Seconds since the epoch
+        
+    Returns:
+        str: Local time as "YYYY-MM-DD HH:MM:SS"
+    """
+    return datetime.fromtimestamp(ts).isoformat(sep=' ', timespec='seconds')
+
+
+def entry_timestamp(entry):
+    """
+    Return the display timestamp of a history entry
+    
+    Entries store an epoch "ts"; older entries carry a preformatted "timestamp".
+    
+    Args:
+        entry (dict): The conversation entry
+        
+    Returns:
+        str: The formatted timestamp
+    """
+    if "ts" in entry:
+        return format_timestamp(int(entry["ts"]))
+    return entry.get("timestamp", "")
 
 
 # ============================================================================
@@ -69,27 +483,78 @@ class AIChatbot:
         
         # Initialize Gemini (Google GenAI) client
         # Pass API key explicitly or rely on GEMINI_API_KEY / GOOGLE_API_KEY env vars.
-        self.client = genai.Client(api_key=Config.API_KEY)
+        # The async side keeps HTTP/2 keep-alive connections open for the whole
+        # process, so only the first request pays for the TCP/TLS handshake.
+        transport = httpx.AsyncHTTPTransport(
+            http2=importlib.util.find_spec("h2") is not None,
+            retries=2,
+            limits=httpx.Limits(
+                max_connections=Config.MAX_CONNECTIONS,
+                max_keepalive_connections=Config.MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+        self.client = genai.Client(
+            api_key=Config.API_KEY,
+            http_options=types.HttpOptions(async_client_args={"transport": transport})
+        )
+        
+        # Event loop reused by every async batch call, so pooled connections
+        # (which are bound to the loop that opened them) survive between calls
+        self._loop = asyncio.new_event_loop()
+        atexit.register(self.close)
         
         # Initialize conversation history
         self.conversation_history = []
+        self.migrate_history()
+        
+        # Append-only history file handle, opened on the first save. Each entry
+        # is flushed as it is written; the exit hook is only a backstop.
+        self._history_file = None
+        atexit.register(self._flush_history)
         
         # Current mode (faq or summarize)
         self.current_mode = None
         
+        # Response cache: on disk when diskcache is available, else in-process
+        self._response_cache = None
+        if Config.ENABLE_PROMPT_CACHE:
+            self._response_cache = (
+                diskcache.Cache(Config.PROMPT_CACHE_DIR) if diskcache is not None
+                else LRUCache(Config.PROMPT_CACHE_SIZE)
+            )
+        
+        # Generation configs per system prompt: (config, expires_at) pairs,
+        # built once so every request reuses an identical prefix
+        self._generation_configs = {}
+        
+        # LLMLingua compressor, loaded on first use (model load is expensive);
+        # a failed load disables compression for the rest of the session
+        self._compressor = None
+        self._compression_failed = False
+        
+        # Serializes compressor use when map-reduce chunks are prepared in
+        # worker threads
+        self._compressor_lock = threading.Lock()
+        
+        # Request/token budgets shared by all concurrent requests
+        self._rate_limiter = RateLimiter(
+            Config.MAX_REQUESTS_PER_MINUTE, Config.MAX_TOKENS_PER_MINUTE
+        )
+        
         print("✓ AI Chatbot initialized successfully!")
     
     # ------------------------------------------------------------------------
     # CORE API FUNCTIONS
     # ------------------------------------------------------------------------
     
-    def send_to_openai(self, user_message, system_prompt=None):
+    def send_to_openai(self, user_message, system_prompt=None, stream=False):
         """
         Send a message to the underlying model (Gemini) and get a response
         
         Args:
             user_message (str): The user's input message
             system_prompt (str): Optional system prompt to set behavior
+            stream (bool): Print the response frame and tokens as they arrive
             
         Returns:
             str: The AI's response text
@@ -98,32 +563,25 @@ class AIChatbot:
             Exception: If API call fails
         """
         try:
-            # Prepare messages (we'll convert to a single prompt for Gemini)
-            # Build a single prompt by prepending system prompt (if any)
-            prompt_parts = []
-            if system_prompt:
-                prompt_parts.append(system_prompt.strip())
-            prompt_parts.append(user_message.strip())
-            prompt = "\n\n".join(prompt_parts)
-
-            # Call Gemini generate_content (Google GenAI SDK)
-            # Use types.GenerateContentConfig for generation settings
-            config = types.GenerateContentConfig(
-                temperature=Config.TEMPERATURE,
-                max_output_tokens=Config.MAX_TOKENS
-            )
-
-            response = self.client.models.generate_content(
-                model=Config.MODEL,
-                contents=prompt,
-                config=config
-            )
+            cache_key = self._prompt_cache_key(system_prompt, user_message)
+            ai_response = self._cache_get(cache_key)
+            if ai_response is not None:
+                if stream:
+                    format_response(ai_response)
+                self._save_to_history(user_message, ai_response, self.current_mode)
+                return ai_response
+            
+            if stream:
+                ai_response = self._stream_response(user_message, system_prompt)
+            else:
+                response = self.client.models.generate_content(
+                    model=Config.MODEL,
+                    contents=user_message.strip(),
+                    config=self._generation_config(system_prompt)
+                )
+                ai_response = self._response_text(response)
 
-            # response.text contains the generated text
-            ai_response = getattr(response, "text", None)
-            if ai_response is None:
-                ai_response = str(response)
-            ai_response = ai_response.strip()
+            self._cache_set(cache_key, ai_response)
 
             # Save to conversation history
             self._save_to_history(user_message, ai_response, self.current_mode)
@@ -136,16 +594,364 @@ class AIChatbot:
             print(f"\n❌ {error_message}")
             return None
     
+    def _stream_response(self, user_message, system_prompt=None):
+        """
+        Stream a response to stdout chunk by chunk
+        
+        The response frame is opened on the first chunk, so errors raised
+        before any output don't leave an empty frame behind.
+        
+        Args:
+            user_message (str): The user's input message
+            system_prompt (str): Optional system prompt to set behavior
+            
+        Returns:
+            str: The complete AI response text
+        """
+        response = self.client.models.generate_content_stream(
+            model=Config.MODEL,
+            contents=user_message.strip(),
+            config=self._generation_config(system_prompt)
+        )
+        
+        buf = []
+        try:
+            for chunk in response:
+                delta = chunk.text
+                if not delta:
+                    continue
+                if not buf:
+                    start_response_frame()
+                    delta = delta.lstrip()
+                sys.stdout.write(delta)
+                sys.stdout.flush()
+                buf.append(delta)
+        finally:
+            if buf:
+                end_response_frame()
+        
+        return "".join(buf).strip()
+    
+    async def send_many(self, items, system_prompt=None, num_concurrent=None):
+        """
+        Send many messages to the model concurrently
+        
+        Requests are fired through a semaphore-bounded pool, throttled to
+        Config.MAX_REQUESTS_PER_MINUTE / Config.MAX_TOKENS_PER_MINUTE and
+        retried up to Config.MAX_ATTEMPTS times on 429/5xx errors.
+        
+        Args:
+            items (list): User messages, or (user_message, system_prompt) tuples
+            system_prompt (str): Default system prompt for plain string items
+            num_concurrent (int): Maximum requests in flight
+                (defaults to Config.MAX_CONCURRENT_REQUESTS)
+            
+        Returns:
+            list: The AI's responses in input order (None for failed items)
+        """
+        semaphore = asyncio.Semaphore(num_concurrent or Config.MAX_CONCURRENT_REQUESTS)
+        mode = self.current_mode
+        
+        async def bounded(item):
+            if isinstance(item, tuple):
+                user_message, item_prompt = item
+            else:
+                user_message, item_prompt = item, system_prompt
+            
+            async with semaphore:
+                try:
+                    ai_response = await self._send_async(user_message, item_prompt)
+                except Exception as e:
+                    print(f"\n❌ Error communicating with Gemini API: {str(e)}")
+                    return None
+            
+            self._save_to_history(user_message, ai_response, mode)
+            return ai_response
+        
+        return await asyncio.gather(*[bounded(item) for item in items])
+    
+    async def _send_async(self, user_message, system_prompt=None):
+        """
+        Send a single message through the async client, with throttling and retries
+        
+        Args:
+            user_message (str): The user's input message
+            system_prompt (str): Optional system prompt to set behavior
+            
+        Returns:
+            str: The AI's response text
+            
+        Raises:
+            errors.APIError: If the request still fails after Config.MAX_ATTEMPTS
+        """
+        cache_key = self._prompt_cache_key(system_prompt, user_message)
+        ai_response = self._cache_get(cache_key)
+        if ai_response is not None:
+            return ai_response
+        
+        # Rough estimate: ~4 characters per token plus the response budget
+        estimated_tokens = (len(user_message) + len(system_prompt or "")) // 4 + Config.MAX_TOKENS
+        config = self._generation_config(system_prompt)
+        
+        for attempt in range(1, Config.MAX_ATTEMPTS + 1):
+            await self._rate_limiter.acquire(estimated_tokens)
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=Config.MODEL,
+                    contents=user_message.strip(),
+                    config=config
+                )
+                ai_response = self._response_text(response)
+                self._cache_set(cache_key, ai_response)
+                return ai_response
+            except errors.APIError as e:
+                retryable = e.code == 429 or (e.code or 0) >= 500
+                if not retryable or attempt == Config.MAX_ATTEMPTS:
+                    raise
+                # Exponential backoff before the next attempt
+                await asyncio.sleep(2 ** attempt)
+    
+    def _run(self, coro):
+        """
+        Run a coroutine to completion on the chatbot's persistent event loop
+        
+        Args:
+            coro: The coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        return self._loop.run_until_complete(coro)
+    
+    async def aclose(self):
+        """Close the async client's pooled HTTP connections"""
+        await self.client.aio.aclose()
+    
+    def close(self):
+        """Release the history file and network resources (safe to call twice)"""
+        if self._history_file is not None:
+            try:
+                self._history_file.close()
+            except Exception as e:
+                print(f"Warning: Could not close history file: {e}")
+            self._history_file = None
+        
+        if self._loop.is_closed():
+            return
+        try:
+            self._loop.run_until_complete(self.aclose())
+        except Exception as e:
+            print(f"Warning: Could not close HTTP client: {e}")
+        finally:
+            self._loop.close()
+    
+    # ------------------------------------------------------------------------
+    # BATCH API
+    # ------------------------------------------------------------------------
+    
+    def submit_batch(self, user_messages, system_prompt=None):
+        """
+        Upload requests as a JSONL file and start a Gemini Batch API job
+        
+        Args:
+            user_messages (list): The user messages, one request each
+            system_prompt (str): Optional system prompt for every request
+            
+        Returns:
+            str: The batch job name, to pass to wait_for_batch()
+        """
+        lines = []
+        for i, user_message in enumerate(user_messages):
+            request = {
+                "contents": [{
+                    "role": "user",
+                    "parts": [{"text": user_message.strip()}]
+                }],
+                "generation_config": {
+                    "temperature": Config.TEMPERATURE,
+                    "max_output_tokens": Config.MAX_TOKENS
+                }
+            }
+            if system_prompt:
+                request["system_instruction"] = {"parts": [{"text": system_prompt.strip()}]}
+            lines.append(json.dumps({"key": str(i), "request": request}, ensure_ascii=False))
+        
+        uploaded = self.client.files.upload(
+            file=io.BytesIO(("\n".join(lines) + "\n").encode('utf-8')),
+            config=types.UploadFileConfig(display_name="chatbot-batch", mime_type="jsonl")
+        )
+        
+        job = self.client.batches.create(
+            model=Config.MODEL,
+            src=uploaded.name,
+            config={"display_name": "chatbot-batch"}
+        )
+        print(f"✓ Submitted batch job {job.name} ({len(user_messages)} requests)")
+        
+        return job.name
+    
+    def wait_for_batch(self, job_name, poll_interval=None, timeout=None):
+        """
+        Poll a Gemini Batch API job until it finishes and parse its results
+        
+        Args:
+            job_name (str): The name returned by submit_batch()
+            poll_interval (int): Seconds between status checks
+                (defaults to Config.BATCH_POLL_INTERVAL)
+            timeout (int): Seconds to wait before giving up
+                (defaults to Config.BATCH_TIMEOUT)
+            
+        Returns:
+            dict: Response text keyed by request index (failed requests are
+                missing), or None if the job did not succeed in time
+        """
+        finished_states = {
+            "JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED",
+            "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"
+        }
+        
+        deadline = time.monotonic() + (timeout or Config.BATCH_TIMEOUT)
+        
+        try:
+            job = self.client.batches.get(name=job_name)
+            while job.state.name not in finished_states:
+                if time.monotonic() >= deadline:
+                    print(f"\n❌ Timed out waiting for batch job {job_name} "
+                          f"(last state {job.state.name})")
+                    return None
+                time.sleep(poll_interval or Config.BATCH_POLL_INTERVAL)
+                job = self.client.batches.get(name=job_name)
+            
+            if job.state.name != "JOB_STATE_SUCCEEDED":
+                print(f"\n❌ Batch job {job_name} ended with state {job.state.name}")
+                return None
+            
+            content = self.client.files.download(file=job.dest.file_name)
+        except Exception as e:
+            print(f"\n❌ Error retrieving Gemini batch job: {str(e)}")
+            return None
+        
+        results = {}
+        for line in content.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            try:
+                result = json.loads(line)
+                if not isinstance(result, dict):
+                    raise ValueError("expected a JSON object")
+            except ValueError as e:
+                print(f"Warning: Skipping unreadable batch result line: {e}")
+                continue
+            try:
+                parts = result["response"]["candidates"][0]["content"]["parts"]
+                results[int(result["key"])] = "".join(part.get("text", "") for part in parts).strip()
+            except (KeyError, IndexError, TypeError, ValueError):
+                print(f"Warning: Batch request {result.get('key')} failed: {result.get('error')}")
+        
+        return results
+    
+    # ------------------------------------------------------------------------
+    # REQUEST HELPERS
+    # ------------------------------------------------------------------------
+    
+    def _generation_config(self, system_prompt=None):
+        """
+        Return the generation settings for requests using a system prompt
+        
+        The system prompt is sent as a system instruction rather than mixed
+        into the contents, so every request shares the same stable prefix
+        (which Gemini caches implicitly). With Config.ENABLE_CONTEXT_CACHE,
+        the prompt is registered once as explicit cached content and
+        requests reference it by name instead of resending it. Configs are
+        built once per system prompt and reused until the cache expires.
+        
+        Args:
+            system_prompt (str): Optional system prompt to set behavior
+            
+        Returns:
+            types.GenerateContentConfig: The generation settings
+        """
+        cached = self._generation_configs.get(system_prompt)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
+        instruction = system_prompt.strip() if system_prompt else None
+        config = None
+        expires_at = float('inf')
+        
+        if instruction and Config.ENABLE_CONTEXT_CACHE:
+            try:
+                context_cache = self.client.caches.create(
+                    model=Config.MODEL,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=instruction,
+                        ttl=f"{Config.CONTEXT_CACHE_TTL}s"
+                    )
+                )
+                config = types.GenerateContentConfig(
+                    cached_content=context_cache.name,
+                    temperature=Config.TEMPERATURE,
+                    max_output_tokens=Config.MAX_TOKENS
+                )
+                # Rebuild a minute early so requests never reference an expired cache
+                expires_at = time.monotonic() + Config.CONTEXT_CACHE_TTL - 60
+            except Exception as e:
+                print(f"Warning: Could not create context cache: {e}")
+        
+        if config is None:
+            config = types.GenerateContentConfig(
+                system_instruction=instruction,
+                temperature=Config.TEMPERATURE,
+                max_output_tokens=Config.MAX_TOKENS
+            )
+        
+        self._generation_configs[system_prompt] = (config, expires_at)
+        return config
+    
+    def _prompt_cache_key(self, system_prompt, user_message):
+        """Return the response cache key for a request under the current Config"""
+        return prompt_cache_key(
+            Config.MODEL, Config.TEMPERATURE, Config.MAX_TOKENS, system_prompt, user_message
+        )
+    
+    def _cache_get(self, cache_key):
+        """Return the cached response for a request key, or None on a miss"""
+        if self._response_cache is None:
+            return None
+        try:
+            return self._response_cache.get(cache_key)
+        except Exception as e:
+            print(f"Warning: Could not read prompt cache: {e}")
+            return None
+    
+    def _cache_set(self, cache_key, ai_response):
+        """Store a non-empty response under a request key"""
+        if self._response_cache is None or not ai_response:
+            return
+        try:
+            self._response_cache.set(cache_key, ai_response, expire=Config.PROMPT_CACHE_TTL)
+        except Exception as e:
+            print(f"Warning: Could not write prompt cache: {e}")
+    
+    def _response_text(self, response):
+        """Extract the stripped response text from a Gemini response"""
+        # response.text contains the generated text
+        ai_response = getattr(response, "text", None)
+        if ai_response is None:
+            ai_response = str(response)
+        return ai_response.strip()
+    
     # ------------------------------------------------------------------------
     # MODE-SPECIFIC FUNCTIONS
     # ------------------------------------------------------------------------
     
-    def answer_faq(self, question):
+    def answer_faq(self, question, stream=False):
         """
         Answer a FAQ question using the model
         
         Args:
             question (str): The user's question
+            stream (bool): Print the answer as it is generated
             
         Returns:
             str: The AI's answer
@@ -156,17 +962,43 @@ class AIChatbot:
         # Send to model with FAQ system prompt
         response = self.send_to_openai(
             user_message=question,
-            system_prompt=Config.FAQ_SYSTEM_PROMPT
+            system_prompt=Config.FAQ_SYSTEM_PROMPT,
+            stream=stream
         )
         
         return response
     
-    def summarize_text(self, text):
+    def answer_faq_batch(self, questions):
+        """
+        Answer many FAQ questions, Config.BATCH_SIZE at a time
+        
+        Each batch is sent concurrently through send_many().
+        
+        Args:
+            questions (list): The user's questions
+            
+        Returns:
+            list: The AI's answers in question order (None for failed questions)
+        """
+        self.current_mode = "FAQ"
+        print(f"\n🤖 Processing {len(questions)} questions...")
+        
+        answers = []
+        for start in range(0, len(questions), Config.BATCH_SIZE):
+            batch = questions[start:start + Config.BATCH_SIZE]
+            answers.extend(self._run(
+                self.send_many(batch, system_prompt=Config.FAQ_SYSTEM_PROMPT)
+            ))
+        
+        return answers
+    
+    def summarize_text(self, text, stream=False):
         """
         Summarize a long text using the model
         
         Args:
             text (str): The text to summarize
+            stream (bool): Print the summary as it is generated
             
         Returns:
             str: The summarized text
@@ -174,17 +1006,231 @@ class AIChatbot:
         self.current_mode = "SUMMARIZE"
         print("\n📝 Generating summary...")
         
-        # Create a summarization prompt
-        prompt = f"Please provide a clear and concise summary of the following text:\n\n{text}"
+        # Only texts that can't fit in the model's context are split up
+        if len(text) > Config.MAX_INPUT_CHARS:
+            response = self._run(self.summarize_long(text))
+            if response:
+                if stream:
+                    format_response(response)
+                self._save_to_history(
+                    self._summarize_prompt(text, compress=False), response, self.current_mode
+                )
+            return response
         
         # Send to model with summarization system prompt
         response = self.send_to_openai(
-            user_message=prompt,
-            system_prompt=Config.SUMMARIZE_SYSTEM_PROMPT
+            user_message=self._summarize_prompt(text),
+            system_prompt=Config.SUMMARIZE_SYSTEM_PROMPT,
+            stream=stream
         )
         
         return response
     
+    def summarize_bulk(self, texts, async_batch=True):
+        """
+        Summarize many texts in one go
+        
+        With async_batch, the texts are submitted as a Gemini Batch API job
+        (half the token price, separate rate limits, results within 24h)
+        and this call blocks until the job finishes. Otherwise they are
+        sent concurrently through send_many().
+        
+        Args:
+            texts (list): The texts to summarize
+            async_batch (bool): Use the Batch API instead of live requests
+            
+        Returns:
+            list: The summaries in input order (None for failed texts),
+                or None if the batch job failed
+        """
+        self.current_mode = "SUMMARIZE"
+        print(f"\n📝 Generating {len(texts)} summaries...")
+        
+        prompts = [self._summarize_prompt(text) for text in texts]
+        
+        if not async_batch:
+            return self._run(
+                self.send_many(prompts, system_prompt=Config.SUMMARIZE_SYSTEM_PROMPT)
+            )
+        
+        try:
+            job_name = self.submit_batch(prompts, system_prompt=Config.SUMMARIZE_SYSTEM_PROMPT)
+        except Exception as e:
+            print(f"\n❌ Error submitting Gemini batch job: {str(e)}")
+            return None
+        
+        results = self.wait_for_batch(job_name)
+        if results is None:
+            return None
+        
+        summaries = [results.get(i) for i in range(len(prompts))]
+        for prompt, summary in zip(prompts, summaries):
+            if summary is not None:
+                self._save_to_history(prompt, summary, self.current_mode)
+        
+        return summaries
+    
+    async def summarize_long(self, text):
+        """
+        Summarize a text of any length with a map-reduce pass
+        
+        The text is split into overlapping chunks (Config.CHUNK_SIZE /
+        Config.CHUNK_OVERLAP) that are summarized concurrently; the partial
+        summaries are then merged by a final request using
+        Config.REDUCE_SYSTEM_PROMPT.
+        
+        Args:
+            text (str): The text to summarize
+            
+        Returns:
+            str: The merged summary, or None if no chunk could be summarized
+        """
+        chunks = chunk_text(text, Config.CHUNK_SIZE, Config.CHUNK_OVERLAP)
+        semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_REQUESTS)
+        
+        async def bounded(chunk):
+            async with semaphore:
+                return await self._summarize_chunk(chunk)
+        
+        partials = await asyncio.gather(*[bounded(chunk) for chunk in chunks])
+        partials = [partial for partial in partials if partial]
+        
+        if not partials:
+            return None
+        if len(partials) == 1:
+            return partials[0]
+        
+        return await self._summarize_chunk("\n\n".join(partials), style="reduce")
+    
+    async def _summarize_chunk(self, text, style="map"):
+        """
+        Summarize one chunk (map) or merge partial summaries (reduce)
+        
+        Args:
+            text (str): The chunk text, or the joined partial summaries
+            style (str): "map" or "reduce"
+            
+        Returns:
+            str: The summary, or None if the request failed
+        """
+        if style == "reduce":
+            user_message = (
+                "Combine these partial summaries of one document into a single "
+                f"clear and concise summary:\n\n{text}"
+            )
+            system_prompt = Config.REDUCE_SYSTEM_PROMPT
+        else:
+            # Compression is CPU-bound; run it off the event loop so other
+            # chunks' requests keep flowing meanwhile
+            user_message = await asyncio.to_thread(self._summarize_prompt, text)
+            system_prompt = Config.SUMMARIZE_SYSTEM_PROMPT
+        
+        try:
+            return await self._send_async(user_message, system_prompt)
+        except Exception as e:
+            print(f"\n❌ Error communicating with Gemini API: {str(e)}")
+            return None
+    
+    def _summarize_prompt(self, text, compress=True):
+        """
+        Build the summarization prompt, compressing the text first
+        
+        Args:
+            text (str): The text to summarize
+            compress (bool): Apply rule-based and LLMLingua compression
+            
+        Returns:
+            str: The prompt to send to the model
+        """
+        # Shrink long inputs before they are billed as prompt tokens
+        if compress:
+            if Config.ENABLE_RULE_COMPRESSION:
+                text = rule_compress(text)
+            text = self._compress_text(text)
+        
+        return f"Please provide a clear and concise summary of the following text:\n\n{text}"
+    
+    def _compress_text(self, text):
+        """
+        Compress text with LLMLingua-2 when Config.ENABLE_COMPRESSION is set
+        
+        Long inputs are split into paragraph-aligned chunks and each chunk is
+        compressed separately (coarse-to-fine, as in LongLLMLingua).
+        
+        Args:
+            text (str): The text to compress
+            
+        Returns:
+            str: The compressed text, or the original text if compression
+                is disabled or unavailable
+        """
+        if not Config.ENABLE_COMPRESSION or self._compression_failed:
+            return text
+        
+        if PromptCompressor is None:
+            print("Warning: llmlingua is not installed; sending text uncompressed.")
+            return text
+        
+        with self._compressor_lock:
+            if self._compression_failed:
+                return text
+            
+            if self._compressor is None:
+                try:
+                    self._compressor = PromptCompressor(
+                        model_name=Config.COMPRESSION_MODEL,
+                        device_map=Config.COMPRESSION_DEVICE,
+                        use_llmlingua2=True
+                    )
+                except Exception as e:
+                    self._compression_failed = True
+                    print(f"Warning: Could not load compression model ({e}); "
+                          "compression disabled for this session.")
+                    return text
+            
+            try:
+                compressed = [
+                    self._compressor.compress_prompt(
+                        chunk,
+                        rate=Config.COMPRESSION_RATE,
+                        force_tokens=['\n', '.']
+                    )['compressed_prompt']
+                    for chunk in self._paragraph_chunks(text, Config.COMPRESSION_CHUNK_SIZE)
+                ]
+                return "\n\n".join(compressed)
+            except Exception as e:
+                print(f"Warning: Could not compress text: {e}")
+                return text
+    
+    def _paragraph_chunks(self, text, size):
+        """
+        Group paragraphs into chunks of at most `size` characters
+        
+        Args:
+            text (str): The text to split
+            size (int): Target maximum chunk length (a single longer
+                paragraph becomes its own chunk)
+            
+        Returns:
+            list: The text chunks
+        """
+        chunks = []
+        current = []
+        current_len = 0
+        
+        for paragraph in text.split("\n\n"):
+            if current and current_len + len(paragraph) > size:
+                chunks.append("\n\n".join(current))
+                current = []
+                current_len = 0
+            current.append(paragraph)
+            current_len += len(paragraph) + 2
+        
+        if current:
+            chunks.append("\n\n".join(current))
+        
+        return chunks
+    
     # ------------------------------------------------------------------------
     # HISTORY MANAGEMENT
     # ------------------------------------------------------------------------
@@ -200,79 +1246,198 @@ class AIChatbot:
         """
         # Create a conversation entry
         entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "ts": time.time(),
             "mode": mode,
-            "user_input": user_input[:200] + "..." if len(user_input) > 200 else user_input,
-            "ai_response": ai_response[:200] + "..." if len(ai_response) > 200 else ai_response
+            "user_input": truncate(user_input),
+            "ai_response": truncate(ai_response)
         }
         
         # Add to in-memory history
         self.conversation_history.append(entry)
         
-        # Load existing history from file
+        # Append the new entry as a single JSON line
         try:
-            if os.path.exists(Config.HISTORY_FILE):
-                with open(Config.HISTORY_FILE, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-            else:
-                history = []
+            if self._history_file is None:
+                self._history_file = open(
+                    Config.HISTORY_FILE, 'ab', buffering=Config.IO_BUFFER_SIZE
+                )
+            self._history_file.write(dump_history_line(entry))
+            # Flush every turn so a closed terminal or crash can't lose entries
+            self._history_file.flush()
         except Exception as e:
-            print(f"Warning: Could not load history file: {e}")
-            history = []
+            print(f"Warning: Could not save to history file: {e}")
+    
+    def _flush_history(self):
+        """Flush buffered history writes to disk"""
+        if self._history_file is not None:
+            try:
+                self._history_file.flush()
+            except Exception as e:
+                print(f"Warning: Could not save to history file: {e}")
+    
+    def iter_history(self):
+        """
+        Stream all saved history entries (every session) from the history file
         
-        # Append new entry
-        history.append(entry)
+        Yields:
+            dict: One conversation entry at a time, oldest first
+        """
+        if not os.path.exists(Config.HISTORY_FILE):
+            return
+        
+        with open(Config.HISTORY_FILE, 'rb', buffering=Config.IO_BUFFER_SIZE) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = load_history_json(line)
+                except ValueError as e:
+                    # e.g. a line torn by a crash mid-write
+                    print(f"Warning: Skipping unreadable history line {line_number}: {e}")
+                    continue
+                yield entry
+    
+    def migrate_history(self):
+        """
+        Convert a legacy chat_history.json array into the JSON Lines history file
+        
+        Runs once: the legacy file is renamed to *.bak after a successful
+        conversion, and nothing happens if the JSONL file already exists.
+        """
+        legacy_file = Config.LEGACY_HISTORY_FILE
+        if not os.path.exists(legacy_file) or os.path.exists(Config.HISTORY_FILE):
+            return
         
-        # Save back to file
         try:
-            with open(Config.HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            # Write to a temp file first so a failed run can simply be retried
+            tmp_file = Config.HISTORY_FILE + ".tmp"
+            count = 0
+            with open(legacy_file, 'rb', buffering=Config.IO_BUFFER_SIZE) as src, \
+                    open(tmp_file, 'wb', buffering=Config.IO_BUFFER_SIZE) as dst:
+                for count, entry in enumerate(self._iter_legacy_history(src), 1):
+                    dst.write(dump_history_line(entry))
+                    if count % Config.HISTORY_GC_INTERVAL == 0:
+                        gc.collect()
+            
+            os.replace(tmp_file, Config.HISTORY_FILE)
+            os.replace(legacy_file, legacy_file + ".bak")
+            print(f"✓ Migrated {count} history entries to '{Config.HISTORY_FILE}'")
         except Exception as e:
-            print(f"Warning: Could not save to history file: {e}")
+            print(f"Warning: Could not migrate history file: {e}")
     
-    def view_history(self):
-        """Display the conversation history from the current session"""
-        if not self.conversation_history:
+    def _iter_legacy_history(self, f):
+        """
+        Yield entries from a legacy JSON array history file
+        
+        Uses ijson to parse one entry at a time when it is installed, so
+        memory stays bounded by a single entry rather than the whole file.
+        
+        Args:
+            f: The legacy history file, opened in binary mode
+            
+        Yields:
+            dict: One conversation entry at a time
+        """
+        if ijson is not None:
+            yield from ijson.items(f, 'item', use_float=True)
+        else:
+            yield from load_history_json(f.read())
+    
+    def view_history(self, all_sessions=False):
+        """
+        Display the conversation history
+        
+        Args:
+            all_sessions (bool): Stream every saved entry from the history
+                file instead of only the current session
+        """
+        entries = self.iter_history() if all_sessions else self.conversation_history
+        title = "All Sessions" if all_sessions else "Current Session"
+        
+        if not all_sessions and not self.conversation_history:
             print("\n📭 No conversation history yet in this session.")
             return
         
-        print("\n" + "="*60)
-        print("CONVERSATION HISTORY (Current Session)")
-        print("="*60)
+        write_frame(f"\n{RULE}\nCONVERSATION HISTORY ({title})\n{RULE}\n")
         
-        for i, entry in enumerate(self.conversation_history, 1):
-            print(f"\n[{i}] {entry['timestamp']} - Mode: {entry['mode']}")
-            print(f"User: {entry['user_input']}")
-            print(f"AI: {entry['ai_response']}")
-            print("-" * 60)
+        for i, entry in enumerate(entries, 1):
+            write_frame(
+                f"\n[{i}] {entry_timestamp(entry)} - Mode: {entry['mode']}\n"
+                f"User: {entry['user_input']}\n"
+                f"AI: {entry['ai_response']}\n"
+                f"{THIN_RULE}\n"
+            )
+            
+            # Release parsed entries periodically when streaming large files
+            if all_sessions and i % Config.HISTORY_GC_INTERVAL == 0:
+                gc.collect()
 
 
 # ============================================================================
 # USER INTERFACE FUNCTIONS
 # ============================================================================
 
+# Static screens are built once and written with a single call each
+RULE = "=" * 60
+THIN_RULE = "-" * 60
+
+WELCOME_FRAME = (
+    f"\n{RULE}\n"
+    "🤖 AI CHATBOT - FAQ Answering & Text Summarization\n"
+    f"{RULE}\n"
+    "\nWelcome! This chatbot can help you with:\n"
+    "  1. Answering frequently asked questions\n"
+    "  2. Summarizing long texts\n"
+    f"\nAll conversations are saved to '{Config.HISTORY_FILE}'\n"
+    f"{RULE}\n\n"
+)
+
+MENU_FRAME = (
+    f"\n{THIN_RULE}\n"
+    "MAIN MENU\n"
+    f"{THIN_RULE}\n"
+    "1. Ask a FAQ Question\n"
+    "2. Summarize Text\n"
+    "3. View Conversation History\n"
+    "4. Exit\n"
+    f"{THIN_RULE}\n"
+)
+
+FAQ_MODE_FRAME = f"\n{RULE}\nFAQ MODE - Ask Your Question\n{RULE}\n"
+SUMMARIZE_MODE_FRAME = f"\n{RULE}\nSUMMARIZATION MODE - Enter Text to Summarize\n{RULE}\n"
+
+GOODBYE_FRAME = (
+    f"\n{RULE}\n"
+    "👋 Thank you for using AI Chatbot!\n"
+    f"💾 Your chat history has been saved to '{Config.HISTORY_FILE}'\n"
+    f"{RULE}\n\n"
+)
+
+VALID_CHOICES = frozenset({'1', '2', '3', '4'})
+
+RESPONSE_HEADER = f"\n{RULE}\n🤖 AI RESPONSE:\n{RULE}\n\n"
+RESPONSE_FOOTER = f"\n\n{RULE}\n"
+
+
+def write_frame(text):
+    """
+    Write a pre-built block of text to the terminal in one call
+    
+    Args:
+        text (str): The text to display
+    """
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 def display_welcome():
     """Display welcome message and instructions"""
-    print("\n" + "="*60)
-    print("🤖 AI CHATBOT - FAQ Answering & Text Summarization")
-    print("="*60)
-    print("\nWelcome! This chatbot can help you with:")
-    print("  1. Answering frequently asked questions")
-    print("  2. Summarizing long texts")
-    print("\nAll conversations are saved to 'chat_history.json'")
-    print("="*60 + "\n")
+    write_frame(WELCOME_FRAME)
 
 
 def display_menu():
     """Display the main menu options"""
-    print("\n" + "-"*60)
-    print("MAIN MENU")
-    print("-"*60)
-    print("1. Ask a FAQ Question")
-    print("2. Summarize Text")
-    print("3. View Conversation History")
-    print("4. Exit")
-    print("-"*60)
+    write_frame(MENU_FRAME)
 
 
 def get_user_choice():
@@ -284,7 +1449,7 @@ def get_user_choice():
     """
     while True:
         choice = input("\nEnter your choice (1-4): ").strip()
-        if choice in ['1', '2', '3', '4']:
+        if choice in VALID_CHOICES:
             return choice
         print("❌ Invalid choice. Please enter 1, 2, 3, or 4.")
 
@@ -322,6 +1487,16 @@ def get_multiline_input(prompt):
     return '\n'.join(lines).strip()
 
 
+def start_response_frame():
+    """Display the banner printed before the AI's response"""
+    write_frame(RESPONSE_HEADER)
+
+
+def end_response_frame():
+    """Display the footer printed after the AI's response"""
+    write_frame(RESPONSE_FOOTER)
+
+
 def format_response(response):
     """
     Format and display the AI's response nicely
@@ -330,11 +1505,7 @@ def format_response(response):
         response (str): The AI's response to format
     """
     if response:
-        print("\n" + "="*60)
-        print("🤖 AI RESPONSE:")
-        print("="*60)
-        print(f"\n{response}\n")
-        print("="*60)
+        write_frame("".join([RESPONSE_HEADER, response, RESPONSE_FOOTER]))
     else:
         print("\n❌ Failed to get a response. Please try again.")
 
@@ -343,6 +1514,63 @@ def format_response(response):
 # MAIN APPLICATION FLOW
 # ============================================================================
 
+def handle_faq(chatbot):
+    """
+    Run FAQ mode: ask for a question and stream the answer
+    
+    Args:
+        chatbot (AIChatbot): The active chatbot
+    """
+    write_frame(FAQ_MODE_FRAME)
+    question = input("\nYour question: ").strip()
+    
+    if question:
+        # Streamed responses are printed as they arrive
+        response = chatbot.answer_faq(question, stream=True)
+        if not response:
+            format_response(response)
+    else:
+        print("❌ Question cannot be empty!")
+
+
+def handle_summarize(chatbot):
+    """
+    Run summarization mode: read multi-line text and stream its summary
+    
+    Args:
+        chatbot (AIChatbot): The active chatbot
+    """
+    write_frame(SUMMARIZE_MODE_FRAME)
+    text = get_multiline_input("Paste or type the text you want to summarize:")
+    
+    if text:
+        response = chatbot.summarize_text(text, stream=True)
+        if not response:
+            format_response(response)
+    elif text is None:
+        print("❌ Cancelled.")
+    else:
+        print("❌ Text cannot be empty!")
+
+
+def handle_history(chatbot):
+    """
+    Show the current session's conversation history
+    
+    Args:
+        chatbot (AIChatbot): The active chatbot
+    """
+    chatbot.view_history()
+
+
+# Menu choice -> handler ('4' exits and is handled in main)
+CHOICE_HANDLERS = {
+    '1': handle_faq,
+    '2': handle_summarize,
+    '3': handle_history,
+}
+
+
 def main():
     """Main function to run the chatbot application"""
     
@@ -368,50 +1596,16 @@ def main():
         # Get user choice
         choice = get_user_choice()
         
-        # Handle user choice
-        if choice == '1':
-            # FAQ Mode
-            print("\n" + "="*60)
-            print("FAQ MODE - Ask Your Question")
-            print("="*60)
-            question = input("\nYour question: ").strip()
-            
-            if question:
-                response = chatbot.answer_faq(question)
-                format_response(response)
-            else:
-                print("❌ Question cannot be empty!")
-        
-        elif choice == '2':
-            # Summarize Mode
-            print("\n" + "="*60)
-            print("SUMMARIZATION MODE - Enter Text to Summarize")
-            print("="*60)
-            text = get_multiline_input("Paste or type the text you want to summarize:")
-            
-            if text:
-                response = chatbot.summarize_text(text)
-                format_response(response)
-            elif text is None:
-                print("❌ Cancelled.")
-            else:
-                print("❌ Text cannot be empty!")
-        
-        elif choice == '3':
-            # View History
-            chatbot.view_history()
-        
-        elif choice == '4':
+        if choice == '4':
             # Exit
-            print("\n" + "="*60)
-            print("👋 Thank you for using AI Chatbot!")
-            print(f"💾 Your chat history has been saved to '{Config.HISTORY_FILE}'")
-            print("="*60 + "\n")
+            write_frame(GOODBYE_FRAME)
             break
         
+        # Handle user choice
+        CHOICE_HANDLERS[choice](chatbot)
+        
         # Ask if user wants to continue
-        if choice in ['1', '2', '3']:
-            input("\nPress Enter to continue...")
+        input("\nPress Enter to continue...")
 
 
 # ============================================================================